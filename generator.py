@@ -15,16 +15,19 @@ Output:
     data/.health            - Health status for monitoring
 """
 
+import os
+import re
 import sys
-import json
 import math
 import time
 import shutil
 import argparse
 import logging
 import subprocess
+import orjson
 import requests
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from requests.adapters import HTTPAdapter
@@ -35,6 +38,7 @@ from urllib3.util.retry import Retry
 # ============================================================================
 
 BASE_DIR = Path(__file__).resolve().parent
+BASE_DIR_STR = str(BASE_DIR)  # For subprocess cwd
 CONFIG_DIR = BASE_DIR / "config"
 DATA_DIR = BASE_DIR / "data"
 LOGS_DIR = BASE_DIR / "logs"
@@ -55,6 +59,8 @@ MAX_BACKUPS = 5
 MAX_HISTORY_POINTS = 2000  # Keep ~2 weeks at 15-min intervals
 RETRY_ATTEMPTS = 3
 RETRY_BACKOFF = 1.0
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+MAX_WORKERS = 16  # Concurrent API requests (also sizes the connection pool)
 
 # Cohort rebalance date - auto-derived from wallets.txt mtime.
 # The rebalance pipeline overwrites wallets.txt on each weekly rebalance,
@@ -97,7 +103,11 @@ def create_session():
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["POST"]
     )
-    session.mount('https://', HTTPAdapter(max_retries=retries))
+    session.mount('https://', HTTPAdapter(
+        max_retries=retries,
+        pool_connections=MAX_WORKERS,
+        pool_maxsize=MAX_WORKERS,
+    ))
     return session
 
 api_session = create_session()
@@ -106,17 +116,16 @@ api_session = create_session()
 # WALLET LOADING
 # ============================================================================
 
+WALLET_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
 def load_wallets():
     """Load wallet addresses from config file."""
     if not WALLETS_FILE.exists():
         raise FileNotFoundError(f"Wallet file not found: {WALLETS_FILE}")
 
-    wallets = []
+    # fullmatch also rejects 42-char lines that aren't valid hex
     with WALLETS_FILE.open("r") as f:
-        for line in f:
-            w = line.strip()
-            if w and w.startswith("0x") and len(w) == 42:
-                wallets.append(w)
+        wallets = [w for w in (line.strip() for line in f) if WALLET_RE.fullmatch(w)]
 
     if not wallets:
         raise ValueError(f"No valid wallets in {WALLETS_FILE}")
@@ -194,6 +203,33 @@ def get_positions(addr):
 # INDEX BUILDING
 # ============================================================================
 
+def conviction(contribs):
+    """Equity-based, sqrt-weighted conviction over (net_i, eq_i, sqrt_weight) tuples.
+
+    Returns (long_count, short_count, conv_equity). Callers pass only
+    non-dust positions from wallets with positive equity, with
+    sqrt_weight = sqrt(eq_i / 100k) precomputed once per wallet.
+    """
+    L_index_equity = 0.0
+    weight_sum_equity = 0.0
+    long_count = 0
+    short_count = 0
+
+    for net_i, eq_i, sqrt_weight in contribs:
+        if net_i > 0:
+            long_count += 1
+        else:
+            short_count += 1
+
+        L_equity_i = net_i / eq_i
+        # sign(L) * |L| * w == L * w, so no branch is needed for the signed sum
+        L_index_equity += L_equity_i * sqrt_weight
+        weight_sum_equity += abs(L_equity_i) * sqrt_weight
+
+    conv_equity = L_index_equity / weight_sum_equity if weight_sum_equity > 0 else 0.0
+    return long_count, short_count, conv_equity
+
+
 def build_index(wallets):
     """Build index data from wallet positions."""
     longs = defaultdict(float)
@@ -202,50 +238,63 @@ def build_index(wallets):
     position_count = defaultdict(int)
     total_equity = 0.0
 
-    wallet_net = defaultdict(lambda: defaultdict(float))
-    wallet_margin = defaultdict(lambda: defaultdict(float))
+    wallet_net = {}  # addr -> {coin: net notional}, kept for daily snapshots
     wallet_equity = {}
     wallet_long_total = defaultdict(float)
     wallet_short_total = defaultdict(float)
     wallet_total_notional = defaultdict(float)
+    coin_contribs = defaultdict(list)  # coin -> [(net_i, eq_i, sqrt_weight), ...] for conviction
 
     failed = 0
     failed_wallets = []
 
-    for i, addr in enumerate(wallets, 1):
-        try:
-            positions, equity = get_positions(addr)
-        except Exception as e:
-            logger.warning(f"[{i}/{len(wallets)}] Wallet {addr[:10]}... failed: {e}")
-            failed += 1
-            failed_wallets.append(addr[:10])
-            continue
-
-        total_equity += equity
-        wallet_equity[addr] = equity
-
-        for pos in positions:
-            coin = pos["coin"]
-            size = pos["size"]
-            notional = pos["notional"]
-            margin_used = pos["margin_used"]
-
-            position_count[coin] += 1
-            margin_sum[coin] += margin_used
-            wallet_margin[addr][coin] += margin_used
+    # Fetch concurrently (I/O-bound), aggregate serially in wallet order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(get_positions, addr) for addr in wallets]
 
-            if size > 0:
-                wallet_net[addr][coin] += notional
-                longs[coin] += notional
-                wallet_long_total[addr] += notional
-            elif size < 0:
-                wallet_net[addr][coin] -= notional
-                shorts[coin] += notional
-                wallet_short_total[addr] += notional
-            wallet_total_notional[addr] += abs(notional)
+        for i, (addr, future) in enumerate(zip(wallets, futures), 1):
+            try:
+                positions, equity = future.result()
+            except Exception as e:
+                logger.warning(f"[{i}/{len(wallets)}] Wallet {addr[:10]}... failed: {e}")
+                failed += 1
+                failed_wallets.append(addr[:10])
+                continue
 
-        if i % 10 == 0:
-            logger.info(f"[{i}/{len(wallets)}] wallets processed...")
+            total_equity += equity
+            wallet_equity[addr] = equity
+            net_by_coin = defaultdict(float)
+            wallet_net[addr] = net_by_coin
+
+            for pos in positions:
+                coin = pos["coin"]
+                size = pos["size"]
+                notional = pos["notional"]
+                margin_used = pos["margin_used"]
+
+                position_count[coin] += 1
+                margin_sum[coin] += margin_used
+
+                if size > 0:
+                    net_by_coin[coin] += notional
+                    longs[coin] += notional
+                    wallet_long_total[addr] += notional
+                elif size < 0:
+                    net_by_coin[coin] -= notional
+                    shorts[coin] += notional
+                    wallet_short_total[addr] += notional
+                wallet_total_notional[addr] += abs(notional)
+
+            # Index this wallet's net exposure by coin so conviction only
+            # visits wallets that actually hold the coin
+            if equity > 0:
+                sqrt_weight = math.sqrt(equity / 100_000.0)
+                for coin, net_i in net_by_coin.items():
+                    if abs(net_i) >= 1e-8:
+                        coin_contribs[coin].append((net_i, equity, sqrt_weight))
+
+            if i % 10 == 0:
+                logger.info(f"[{i}/{len(wallets)}] wallets processed...")
 
     logger.info(f"Completed: {len(wallets) - failed}/{len(wallets)} wallets, equity=${total_equity:,.0f}")
     if failed > 0:
@@ -254,11 +303,8 @@ def build_index(wallets):
     # Build asset rows
     MIN_NOTIONAL = 250_000
 
-    coins = sorted(
-        set(list(longs.keys()) + list(shorts.keys())),
-        key=lambda c: longs[c] + shorts[c],
-        reverse=True,
-    )
+    totals = {c: longs[c] + shorts[c] for c in longs.keys() | shorts.keys()}
+    coins = sorted(totals, key=totals.__getitem__, reverse=True)
 
     assets = []
     global_long = 0.0
@@ -267,7 +313,7 @@ def build_index(wallets):
     for coin in coins:
         long_n = longs[coin]
         short_n = shorts[coin]
-        total = long_n + short_n
+        total = totals[coin]
         if total <= 0:
             continue
 
@@ -288,37 +334,7 @@ def build_index(wallets):
         L_net_equity = net / total_equity if total_equity > 0 else 0.0
 
         # Conviction (equity-based, sqrt-weighted)
-        L_index_equity = 0.0
-        weight_sum_equity = 0.0
-        long_count = 0
-        short_count = 0
-
-        for addr in wallets:
-            net_i = wallet_net[addr].get(coin, 0.0)
-            if abs(net_i) < 1e-8:
-                continue
-
-            eq_i = wallet_equity.get(addr, 0.0)
-            if eq_i <= 0:
-                continue
-
-            if net_i > 0:
-                long_count += 1
-            else:
-                short_count += 1
-
-            L_equity_i = net_i / eq_i
-            if abs(L_equity_i) <= 0:
-                continue
-
-            sqrt_weight = math.sqrt(eq_i / 100_000.0) if eq_i > 0 else 0.0
-            abs_L = abs(L_equity_i)
-            sign = 1 if L_equity_i >= 0 else -1
-            conv_e = abs_L * sqrt_weight
-            L_index_equity += sign * abs_L * sqrt_weight
-            weight_sum_equity += conv_e
-
-        conv_equity = L_index_equity / weight_sum_equity if weight_sum_equity > 0 else 0.0
+        long_count, short_count, conv_equity = conviction(coin_contribs[coin])
 
         asset_data = {
             "asset": coin,
@@ -338,9 +354,15 @@ def build_index(wallets):
     # Sort by absolute net position
     assets.sort(key=lambda a: abs(a["net_usd"]), reverse=True)
 
-    # Mark top 5 as free (for freemium model)
+    # Single pass: mark top 5 as free (for freemium model) and accumulate
+    # the gross-notional-weighted index score
+    total_abs_notional = 0.0
+    weighted_L_net_equity = 0.0
     for i, asset in enumerate(assets):
         asset["free"] = i < 5
+        gross = asset["long_usd"] + asset["short_usd"]
+        total_abs_notional += gross
+        weighted_L_net_equity += asset["L_net_equity"] * gross
 
     # Cohort stats
     global_net = global_long - global_short
@@ -348,20 +370,25 @@ def build_index(wallets):
     L_cohort_total = gross_notional / total_equity if total_equity > 0 else 0.0
 
     # Calculate overall index score
-    total_abs_notional = sum(a["long_usd"] + a["short_usd"] for a in assets)
-    if total_abs_notional > 0:
-        index_score = sum(
-            a["L_net_equity"] * (a["long_usd"] + a["short_usd"]) / total_abs_notional
-            for a in assets
-        )
-    else:
-        index_score = 0.0
-
-    # Per-asset breakdown for history
-    btc_data = next((a for a in assets if a["asset"] == "BTC"), None)
-    eth_data = next((a for a in assets if a["asset"] == "ETH"), None)
-    sol_data = next((a for a in assets if a["asset"] == "SOL"), None)
-    hype_data = next((a for a in assets if a["asset"] == "HYPE"), None)
+    index_score = weighted_L_net_equity / total_abs_notional if total_abs_notional > 0 else 0.0
+
+    # Per-asset breakdown for history (one lookup table instead of a scan per asset)
+    by_symbol = {a["asset"]: a for a in assets}
+    tracked = [(sym.lower(), by_symbol.get(sym, {})) for sym in ("BTC", "ETH", "SOL", "HYPE")]
+    history_data = {f"{key}_net_usd": a.get("net_usd", 0) for key, a in tracked}
+    history_data.update({f"{key}_conv": a.get("conv_equity", 0) for key, a in tracked})
+
+    # Per-wallet figures, rounded once and shared by the distribution and snapshots
+    wallet_rows = [
+        (i, addr, {
+            "net_notional": round(wallet_long_total[addr] - wallet_short_total[addr], 2),
+            "long_notional": round(wallet_long_total[addr], 2),
+            "short_notional": round(wallet_short_total[addr], 2),
+            "equity": round(wallet_equity[addr], 2),
+        })
+        for i, addr in enumerate(wallets)
+        if addr in wallet_equity
+    ]
 
     output = {
         "generated_at": datetime.now().isoformat(),
@@ -371,7 +398,7 @@ def build_index(wallets):
         "cohort_stats": {
             "total_equity": round(total_equity, 2),
             "total_wallets": len(wallets),
-            "active_wallets": len([a for a in wallets if a in wallet_equity]),
+            "active_wallets": len(wallet_equity),
             "gross_long_usd": round(global_long, 2),
             "gross_short_usd": round(global_short, 2),
             "net_usd": round(global_net, 2),
@@ -382,30 +409,12 @@ def build_index(wallets):
         # Per-wallet data for distribution histogram (no addresses exposed)
         # Sorted by abs net notional descending — same order used for all tabs
         "wallet_distribution": sorted(
-            [
-                {
-                    "net_notional": round(wallet_long_total[addr] - wallet_short_total[addr], 2),
-                    "long_notional": round(wallet_long_total[addr], 2),
-                    "short_notional": round(wallet_short_total[addr], 2),
-                    "equity": round(wallet_equity.get(addr, 0), 2),
-                }
-                for addr in wallets
-                if addr in wallet_equity
-            ],
+            (row for _, _, row in wallet_rows),
             key=lambda w: abs(w["net_notional"]),
             reverse=True,
         ),
         # Include key metrics for history tracking
-        "_history_data": {
-            "btc_net_usd": btc_data["net_usd"] if btc_data else 0,
-            "eth_net_usd": eth_data["net_usd"] if eth_data else 0,
-            "sol_net_usd": sol_data["net_usd"] if sol_data else 0,
-            "hype_net_usd": hype_data["net_usd"] if hype_data else 0,
-            "btc_conv": btc_data["conv_equity"] if btc_data else 0,
-            "eth_conv": eth_data["conv_equity"] if eth_data else 0,
-            "sol_conv": sol_data["conv_equity"] if sol_data else 0,
-            "hype_conv": hype_data["conv_equity"] if hype_data else 0,
-        },
+        "_history_data": history_data,
         # Per-wallet per-asset positions for daily snapshots (not written to index_latest)
         # NOTE: Wallet addresses are NEVER exposed in public output.
         # Snapshots are local-only (data/snapshots/ is in .gitignore).
@@ -413,15 +422,14 @@ def build_index(wallets):
             {
                 "idx": i,
                 "addr": addr,
-                "equity": round(wallet_equity.get(addr, 0), 2),
-                "net_notional": round(wallet_long_total[addr] - wallet_short_total[addr], 2),
+                "equity": row["equity"],
+                "net_notional": row["net_notional"],
                 "positions": {
                     coin: round(net_val, 2)
                     for coin, net_val in wallet_net[addr].items()
                 },
             }
-            for i, addr in enumerate(wallets)
-            if addr in wallet_equity
+            for i, addr, row in wallet_rows
         ],
     }
 
@@ -431,19 +439,25 @@ def build_index(wallets):
 # HISTORY MANAGEMENT
 # ============================================================================
 
-def update_history(index_data):
-    """Append current snapshot to history and maintain rolling window."""
-
-    # Load existing history or create new
+def load_history():
+    """Load history.json, or return an empty history if missing/unreadable."""
     if HISTORY_PATH.exists():
         try:
-            with open(HISTORY_PATH, 'r') as f:
-                history = json.load(f)
-        except (json.JSONDecodeError, IOError):
+            return orjson.loads(HISTORY_PATH.read_bytes())
+        except (orjson.JSONDecodeError, OSError):
             logger.warning("Could not read history.json, starting fresh")
-            history = {"hourly": [], "recent_24h": []}
-    else:
-        history = {"hourly": [], "recent_24h": []}
+    return {"hourly": [], "recent_24h": []}
+
+
+def update_history(index_data, history=None):
+    """Append current snapshot to history and maintain rolling window.
+
+    Pass an already-loaded history to update it in place and skip the disk read.
+    """
+
+    # Load existing history or create new
+    if history is None:
+        history = load_history()
 
     # Create history point from current data
     stats = index_data["cohort_stats"]
@@ -469,37 +483,36 @@ def update_history(index_data):
     }
 
     # Add to recent (full resolution)
-    history.setdefault("recent_24h", []).append(point)
+    recent = history.setdefault("recent_24h", [])
+    recent.append(point)
 
-    # Trim recent to last 24 hours (96 points at 15-min intervals)
-    if len(history["recent_24h"]) > 96:
-        history["recent_24h"] = history["recent_24h"][-96:]
+    # Trim recent to last 24 hours (96 points at 15-min intervals), in place
+    if len(recent) > 96:
+        del recent[:-96]
 
     # Add to hourly (downsample by keeping latest per hour)
     try:
         dt = datetime.fromisoformat(point["timestamp"])
         hour_key = dt.strftime("%Y-%m-%d %H:00")
 
-        # Find if we already have this hour
+        # Runs are monotonic in time, so only the newest entry can share this hour
         hourly = history.setdefault("hourly", [])
-        existing_idx = None
-        for i, h in enumerate(hourly):
+        same_hour = False
+        if hourly:
             try:
-                h_dt = datetime.fromisoformat(h["timestamp"])
-                if h_dt.strftime("%Y-%m-%d %H:00") == hour_key:
-                    existing_idx = i
-                    break
-            except:
-                continue
+                last_dt = datetime.fromisoformat(hourly[-1]["timestamp"])
+                same_hour = last_dt.strftime("%Y-%m-%d %H:00") == hour_key
+            except (KeyError, TypeError, ValueError):
+                pass
 
-        if existing_idx is not None:
-            hourly[existing_idx] = point  # Update existing hour
+        if same_hour:
+            hourly[-1] = point  # Update existing hour
         else:
             hourly.append(point)  # New hour
 
-        # Trim hourly to max points
+        # Trim hourly to max points, in place
         if len(hourly) > MAX_HISTORY_POINTS:
-            history["hourly"] = hourly[-MAX_HISTORY_POINTS:]
+            del hourly[:-MAX_HISTORY_POINTS]
 
     except Exception as e:
         logger.warning(f"Error updating hourly history: {e}")
@@ -521,18 +534,24 @@ def update_history(index_data):
 # ============================================================================
 
 def atomic_write_json(data, output_path):
-    """Write JSON atomically: temp file -> validate -> rename."""
+    """Write JSON atomically: temp file -> fsync -> rename."""
     temp_path = output_path.with_suffix('.tmp')
 
-    with open(temp_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with open(temp_path, "wb") as f:
+        f.write(orjson.dumps(data, option=JSON_OPTIONS))
+        f.flush()
+        os.fsync(f.fileno())
 
-    # Validate
-    with open(temp_path, "r", encoding="utf-8") as f:
-        json.load(f)
+    # Atomic rename (os.replace also overwrites atomically on Windows)
+    os.replace(temp_path, output_path)
 
-    # Atomic rename
-    temp_path.rename(output_path)
+    # Persist the rename itself; directories can't be opened for fsync on Windows
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(output_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
 
 def backup_existing(output_path, backup_dir, max_backups=MAX_BACKUPS):
@@ -570,7 +589,7 @@ def write_health_status(success, wallets_total, wallets_failed, index_score):
         "failure_rate": round(wallets_failed / wallets_total, 3) if wallets_total > 0 else 0
     }
     try:
-        HEALTH_FILE.write_text(json.dumps(health_data, indent=2))
+        HEALTH_FILE.write_bytes(orjson.dumps(health_data, option=JSON_OPTIONS))
     except Exception as e:
         logger.warning(f"Failed to write health file: {e}")
 
@@ -578,6 +597,11 @@ def write_health_status(success, wallets_total, wallets_failed, index_score):
 # GIT PUSH (for static hosting via GitHub)
 # ============================================================================
 
+# Shared subprocess kwargs for git calls (check= is passed per call)
+GIT_RUN_KW = dict(cwd=BASE_DIR_STR, capture_output=True)
+# `git commit` notices when nothing is staged (clean / unstaged-only / untracked-only)
+GIT_NOTHING_TO_COMMIT = ("nothing to commit", "no changes added to commit", "nothing added to commit")
+
 def git_push_data():
     """Commit updated data files and push to GitHub for static hosting.
 
@@ -590,29 +614,29 @@ def git_push_data():
         # Stage ONLY the public data files — never wallet addresses or snapshots
         subprocess.run(
             ["git", "add", "data/index_latest.json", "data/history.json"],
-            cwd=str(BASE_DIR), check=True, capture_output=True
+            check=True, **GIT_RUN_KW
         )
 
-        # Check if there's anything to commit
-        result = subprocess.run(
-            ["git", "diff", "--cached", "--quiet"],
-            cwd=str(BASE_DIR), capture_output=True
-        )
-        if result.returncode == 0:
-            logger.info("Git: no data changes to commit")
-            return
-
-        # Commit with timestamp
+        # Commit with timestamp. No separate `git diff --cached` probe: an empty
+        # commit exits non-zero with a "nothing ..." notice (LC_ALL=C keeps it English)
         ts = datetime.now().strftime("%Y-%m-%d %H:%M UTC")
-        subprocess.run(
+        result = subprocess.run(
             ["git", "commit", "-m", f"data: update index {ts}"],
-            cwd=str(BASE_DIR), check=True, capture_output=True
+            env={**os.environ, "LC_ALL": "C"}, **GIT_RUN_KW
         )
+        if result.returncode != 0:
+            output = result.stdout.decode()
+            if any(msg in output for msg in GIT_NOTHING_TO_COMMIT):
+                logger.info("Git: no data changes to commit")
+                return
+            raise subprocess.CalledProcessError(
+                result.returncode, result.args, result.stdout, result.stderr
+            )
 
         # Push (explicit origin/branch avoids failure if tracking not configured)
         result = subprocess.run(
             ["git", "push", "origin", "main"],
-            cwd=str(BASE_DIR), capture_output=True
+            **GIT_RUN_KW
         )
         if result.returncode == 0:
             logger.info("Git: data pushed to GitHub")
@@ -629,8 +653,12 @@ def git_push_data():
 # MAIN GENERATION
 # ============================================================================
 
-def generate():
-    """Generate index data and update history."""
+def generate(history=None):
+    """Generate index data and update history.
+
+    history: in-memory history from a previous run (see run_scheduled);
+    loaded from disk when omitted.
+    """
     logger.info("=" * 50)
     logger.info("HyperIndex Generator - Starting")
     logger.info("=" * 50)
@@ -653,18 +681,20 @@ def generate():
     total = data['cohort_stats']['total_wallets']
     failed_count = total - active
 
+    # Update history (reads _history_data), then strip internal data so the
+    # index can be written as-is
+    history = update_history(data, history)
+    data.pop("_history_data", None)
+    wallet_snapshots = data.pop("_wallet_snapshots", None)
+
     # Backup existing
     backup_existing(INDEX_PATH, BACKUP_DIR)
 
-    # Remove internal data before saving index
-    index_output = {k: v for k, v in data.items() if not k.startswith("_")}
-
     # Write index
-    atomic_write_json(index_output, INDEX_PATH)
+    atomic_write_json(data, INDEX_PATH)
     logger.info(f"Written index: {INDEX_PATH.name}")
 
-    # Update and write history
-    history = update_history(data)
+    # Write history
     atomic_write_json(history, HISTORY_PATH)
     logger.info(f"Updated history: {len(history.get('hourly', []))} points")
 
@@ -672,13 +702,13 @@ def generate():
     now = datetime.now()
     snapshot_dir = DATA_DIR / "snapshots"
     snapshot_file = snapshot_dir / f"{now.strftime('%Y-%m-%d')}.json"
-    if not snapshot_file.exists() and "_wallet_snapshots" in data:
+    if not snapshot_file.exists() and wallet_snapshots is not None:
         try:
             snapshot_dir.mkdir(parents=True, exist_ok=True)
             snapshot_data = {
                 "timestamp": data["generated_at"],
                 "cohort_stats": data["cohort_stats"],
-                "wallets": data["_wallet_snapshots"],
+                "wallets": wallet_snapshots,
             }
             atomic_write_json(snapshot_data, snapshot_file)
             logger.info(f"Daily snapshot written: {snapshot_file.name}")
@@ -709,9 +739,12 @@ def run_scheduled(interval_hours=12):
     """Run on a schedule."""
     logger.info(f"Starting scheduled generation (every {interval_hours}h)")
 
+    # Load history once; each run updates it in place and writes it back
+    history = load_history()
+
     while True:
         try:
-            generate()
+            generate(history)
             logger.info(f"Next run in {interval_hours} hours...")
             time.sleep(interval_hours * 3600)
         except KeyboardInterrupt:
@@ -720,6 +753,8 @@ def run_scheduled(interval_hours=12):
         except Exception as e:
             logger.error(f"Generation failed: {e}", exc_info=True)
             write_health_status(success=False, wallets_total=0, wallets_failed=0, index_score=0)
+            # A failed run may already have appended its point in memory; resync from disk
+            history = load_history()
             logger.info("Retrying in 5 minutes...")
             time.sleep(300)
 
@@ -12,12 +12,20 @@ Press Ctrl+C to exit.
 """
 
 import json
+import heapq
 import time
-import os
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
+# orjson is optional here: the monitor may run on hosts without the wheel
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -33,6 +41,7 @@ SCHEDULE_HOURS = list(range(24))  # Every hour on the hour
 # Display settings
 REFRESH_INTERVAL = 30  # seconds
 BAR_LENGTH = 40
+W = 64  # Inner width of the dashboard box (between borders)
 
 # ANSI color codes
 GREEN = "\033[92m"
@@ -51,34 +60,44 @@ BORDER = ""
 # DATA LOADING
 # ============================================================================
 
-def load_health():
-    """Load health status from .health file."""
-    if not HEALTH_FILE.exists():
+# path -> (st_mtime_ns, parsed data); files only change when the generator runs
+load_cache = {}
+
+
+def load_json_cached(path):
+    """Load a JSON file, reusing the parsed object while its mtime is unchanged."""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
         return None
+
+    cached = load_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
     try:
-        with open(HEALTH_FILE) as f:
-            return json.load(f)
+        data = json_loads(path.read_bytes())
     except (json.JSONDecodeError, IOError):
         return None
+    load_cache[path] = (mtime, data)
+    return data
+
+
+def load_health():
+    """Load health status from .health file."""
+    return load_json_cached(HEALTH_FILE)
 
 
 def load_index():
     """Load current index data."""
-    if not INDEX_FILE.exists():
-        return None
-    try:
-        with open(INDEX_FILE) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return None
+    return load_json_cached(INDEX_FILE)
 
 # ============================================================================
 # SCHEDULE CALCULATIONS
 # ============================================================================
 
-def get_next_run_time():
-    """Calculate the next scheduled run time."""
-    now = datetime.now()
+def get_next_run_time(now):
+    """Calculate the next scheduled run time after `now`."""
     today = now.date()
 
     for hour in SCHEDULE_HOURS:
@@ -91,9 +110,8 @@ def get_next_run_time():
     return datetime.combine(tomorrow, datetime.min.time().replace(hour=SCHEDULE_HOURS[0]))
 
 
-def get_previous_run_time():
-    """Calculate the previous scheduled run time (for progress calculation)."""
-    now = datetime.now()
+def get_previous_run_time(now):
+    """Calculate the previous scheduled run time at or before `now` (for progress calculation)."""
     today = now.date()
 
     # Check today's hours in reverse
@@ -107,6 +125,21 @@ def get_previous_run_time():
     return datetime.combine(yesterday, datetime.min.time().replace(hour=SCHEDULE_HOURS[-1]))
 
 
+@lru_cache(maxsize=4)
+def run_window_for_hour(hour_start):
+    """(previous, next) scheduled run times for the hour starting at hour_start."""
+    return get_previous_run_time(hour_start), get_next_run_time(hour_start)
+
+
+def get_run_window(now):
+    """Return (previous, next) scheduled run times around `now`.
+
+    Schedule slots fall on whole hours, so the window only changes at hour
+    boundaries: both ends come from one instant and are cached per hour.
+    """
+    return run_window_for_hour(now.replace(minute=0, second=0, microsecond=0))
+
+
 def format_duration(seconds):
     """Format seconds as HH:MM:SS."""
     hours, remainder = divmod(int(seconds), 3600)
@@ -118,6 +151,22 @@ def format_time_friendly(dt):
     """Format datetime as friendly string like '6:00 PM'."""
     return dt.strftime("%-I:%M %p")
 
+
+@lru_cache(maxsize=4)
+def format_last_run(last_run_str):
+    """Format the health file's ISO last_run for display (cached: rarely changes)."""
+    try:
+        last_dt = datetime.fromisoformat(last_run_str.replace("Z", "+00:00"))
+        return last_dt.strftime("%Y-%m-%d %H:%M:%S")
+    except:
+        return last_run_str[:19]
+
+
+@lru_cache(maxsize=4)
+def format_next_run(next_run):
+    """Format the next run time as (display, friendly) strings (cached per run slot)."""
+    return next_run.strftime("%Y-%m-%d %H:%M:%S"), format_time_friendly(next_run)
+
 # ============================================================================
 # DISPLAY HELPERS
 # ============================================================================
@@ -137,53 +186,66 @@ def fmt_money(n):
     return f"{sign}${a:.0f}"
 
 
+def abs_net_usd(asset):
+    """Sort key: absolute net notional of an asset row."""
+    return abs(asset.get("net_usd", 0))
+
+
+# Zero-width ANSI escapes still count toward len(); padding adds them back
+ANSI_LEN = {code: len(code) for code in (GREEN, RED, YELLOW, CYAN, WHITE, BOLD, DIM, RESET)}
+
+
+def box_row(inner, codes=(), wide=0):
+    """Wrap `inner` in side borders, padded to W visible columns.
+
+    codes: ANSI escapes used in `inner`. wide: number of double-width
+    glyphs (emoji), which are one char but take two columns.
+    Returns the newline-terminated row as UTF-8 bytes for the frame buffer.
+    """
+    return f"║{inner.ljust(W + sum(ANSI_LEN[c] for c in codes) - wide)}║\n".encode("utf-8")
+
+
+# Every possible default-length bar, indexed by filled cell count
+BAR_TABLE = tuple("█" * i + "░" * (BAR_LENGTH - i) for i in range(BAR_LENGTH + 1))
+
+
 def progress_bar(progress, length=BAR_LENGTH):
     """Generate a progress bar string."""
     filled = int(length * progress)
+    if length == BAR_LENGTH:
+        return BAR_TABLE[max(0, min(filled, length))]
     bar = "█" * filled + "░" * (length - filled)
     return bar
 
 
-def clear_screen():
-    """Clear terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+# Cursor home + clear screen, sent in the same write as each frame
+CLEAR_SCREEN = b"\x1b[H\x1b[2J"
 
 # ============================================================================
-# MAIN DISPLAY
+# STATIC FRAME (rows that never change, built and UTF-8 encoded once at import)
 # ============================================================================
 
-def render_dashboard():
-    """Render the full dashboard display."""
-    health = load_health()
-    index = load_index()
+FRAME_TOP = f"╔{'═' * W}╗\n".encode("utf-8")
+FRAME_HEADER = box_row(f"  {GREEN}🟢 HyperIndex Monitor{RESET}", (GREEN, RESET), wide=1)
+FRAME_SEP = f"╠{'═' * W}╣\n".encode("utf-8")
+FRAME_BLANK = f"║{' ' * W}║\n".encode("utf-8")
+FRAME_COUNTDOWN_TITLE = box_row("  ⏳ Next update in:", wide=1)
+FRAME_INDEX_TITLE = box_row("  📊 Current Index:", wide=1)
+FRAME_POSITIONS_TITLE = box_row("  🔥 Top Positions:", wide=1)
+FRAME_BOTTOM = f"╚{'═' * W}╝\n".encode("utf-8")
+FRAME_HEAD = FRAME_TOP + FRAME_HEADER + FRAME_SEP
 
-    now = datetime.now()
-    next_run = get_next_run_time()
-    prev_run = get_previous_run_time()
-
-    # Calculate progress
-    total_interval = (next_run - prev_run).total_seconds()
-    elapsed = (now - prev_run).total_seconds()
-    remaining = (next_run - now).total_seconds()
-    progress = min(elapsed / total_interval, 1.0) if total_interval > 0 else 0
-
-    # Build display - fixed width of 66 characters inside borders
-    W = 64  # inner width
-    lines = []
+# ============================================================================
+# MAIN DISPLAY
+# ============================================================================
 
-    # Header
-    lines.append(f"╔{'═' * W}╗")
-    lines.append(f"║  {GREEN}🟢 HyperIndex Monitor{RESET}".ljust(W + 12) + "║")
-    lines.append(f"╠{'═' * W}╣")
+def render_status_rows(health, next_run):
+    """Render the Last Run / Next Run rows."""
+    buf = bytearray()
 
     # Last run status
     if health:
-        last_run_str = health.get("last_run", "Unknown")
-        try:
-            last_dt = datetime.fromisoformat(last_run_str.replace("Z", "+00:00"))
-            last_run_display = last_dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
-            last_run_display = last_run_str[:19]
+        last_run_display = format_last_run(health.get("last_run", "Unknown"))
 
         success = health.get("success", False)
         wallets_ok = health.get("wallets_success", 0)
@@ -191,32 +253,28 @@ def render_dashboard():
 
         if success:
             status = f"{GREEN}✅{RESET} ({wallets_ok}/{wallets_total})"
+            status_codes = (GREEN, RESET)
         else:
             status = f"{RED}❌ Failed{RESET}"
+            status_codes = (RED, RESET)
 
         line = f"  Last Run:   {last_run_display}  {status}"
-        lines.append(f"║{line.ljust(W + 14)}║")
+        buf.extend(box_row(line, status_codes, wide=1))
     else:
         line = f"  Last Run:   {YELLOW}No data available{RESET}"
-        lines.append(f"║{line.ljust(W + 14)}║")
+        buf.extend(box_row(line, (YELLOW, RESET)))
 
     # Next run
-    next_run_display = next_run.strftime("%Y-%m-%d %H:%M:%S")
-    next_run_friendly = format_time_friendly(next_run)
+    next_run_display, next_run_friendly = format_next_run(next_run)
     line = f"  Next Run:   {next_run_display}  ({next_run_friendly})"
-    lines.append(f"║{line.ljust(W)}║")
+    buf.extend(box_row(line))
 
-    lines.append(f"║{' ' * W}║")
+    return bytes(buf)
 
-    # Countdown progress bar
-    bar = progress_bar(progress)
-    remaining_str = format_duration(max(0, remaining))
-    pct = progress * 100
-    lines.append(f"║  ⏳ Next update in:{' ' * (W - 20)}║")
-    bar_line = f"  [{bar}] {pct:5.1f}% - {remaining_str}"
-    lines.append(f"║{bar_line.ljust(W)}║")
 
-    lines.append(f"║{' ' * W}║")
+def render_index_rows(index):
+    """Render the Current Index and Top Positions sections, through the bottom border."""
+    buf = bytearray()
 
     # Current index metrics
     if index:
@@ -228,19 +286,19 @@ def render_dashboard():
         score_color = GREEN if score > 0 else RED if score < 0 else RESET
         score_str = f"{score_color}{score:+.4f}{RESET}"
 
-        lines.append(f"║  📊 Current Index:{' ' * (W - 19)}║")
+        buf.extend(FRAME_INDEX_TITLE)
         metric_line = f"     Score: {score_str}  │  Leverage: {leverage:.2f}x  │  Equity: {fmt_money(equity)}"
-        lines.append(f"║{metric_line.ljust(W + 9)}║")
+        buf.extend(box_row(metric_line, (score_color, RESET)))
     else:
-        lines.append(f"║  📊 Current Index: {YELLOW}No data{RESET}".ljust(W + 12) + "║")
+        buf.extend(box_row(f"  📊 Current Index: {YELLOW}No data{RESET}", (YELLOW, RESET), wide=1))
 
-    lines.append(f"║{' ' * W}║")
+    buf.extend(FRAME_BLANK)
 
     # Top 3 positions
-    lines.append(f"║  🔥 Top Positions:{' ' * (W - 19)}║")
+    buf.extend(FRAME_POSITIONS_TITLE)
 
     if index and "assets" in index:
-        assets = sorted(index["assets"], key=lambda a: abs(a.get("net_usd", 0)), reverse=True)[:3]
+        assets = heapq.nlargest(3, index["assets"], key=abs_net_usd)
         for asset in assets:
             name = asset.get("asset", "???")[:5]
             net = asset.get("net_usd", 0)
@@ -252,15 +310,73 @@ def render_dashboard():
             tilt_str = f"{tilt:+.0f}%"
 
             pos_line = f"     {name:<5} {net_str}  (Tilt: {tilt_str:>5})  Conv: {conv:.2f}"
-            lines.append(f"║{pos_line.ljust(W + 9)}║")
+            buf.extend(box_row(pos_line, (net_color, RESET)))
     else:
-        lines.append(f"║     {DIM}No position data available{RESET}".ljust(W + 8) + "║")
+        buf.extend(box_row(f"     {DIM}No position data available{RESET}", (DIM, RESET)))
+
+    buf.extend(FRAME_BOTTOM)
+    return bytes(buf)
+
+
+# Rendered sections keyed on their inputs: name -> (inputs, bytes).
+# load_json_cached returns the same object while a file is unchanged, so
+# an identity check is enough to tell the section is still current.
+section_cache = {}
+
+
+def cached_section(name, render, *inputs):
+    """Return render(*inputs), reusing the last result when the inputs are the same objects."""
+    cached = section_cache.get(name)
+    if cached is not None and all(a is b for a, b in zip(cached[0], inputs)):
+        return cached[1]
+    rendered = render(*inputs)
+    section_cache[name] = (inputs, rendered)
+    return rendered
+
+
+def render_dashboard():
+    """Render the full dashboard display as UTF-8 bytes.
+
+    Only the countdown and footer clock change between most ticks; the
+    status and index sections are re-rendered when their inputs change.
+    """
+    health = load_health()
+    index = load_index()
+
+    # One clock read per frame; the schedule helpers derive from it
+    now = datetime.now()
+    prev_run, next_run = get_run_window(now)
+
+    # Calculate progress
+    total_interval = (next_run - prev_run).total_seconds()
+    elapsed = (now - prev_run).total_seconds()
+    remaining = (next_run - now).total_seconds()
+    progress = min(elapsed / total_interval, 1.0) if total_interval > 0 else 0
+
+    # Build display - fixed inner width W; rows are appended as encoded bytes
+    buf = bytearray(FRAME_HEAD)
+    add = buf.extend
+
+    # next_run comes from the per-hour run-window cache, so it's a stable object too
+    add(cached_section("status", render_status_rows, health, next_run))
+    add(FRAME_BLANK)
+
+    # Countdown progress bar
+    bar = progress_bar(progress)
+    remaining_str = format_duration(max(0, remaining))
+    pct = progress * 100
+    add(FRAME_COUNTDOWN_TITLE)
+    bar_line = f"  [{bar}] {pct:5.1f}% - {remaining_str}"
+    add(box_row(bar_line))
+
+    add(FRAME_BLANK)
+
+    add(cached_section("index", render_index_rows, index))
 
     # Footer
-    lines.append(f"╚{'═' * W}╝")
-    lines.append(f"  {DIM}Press Ctrl+C to exit  │  Updates every {REFRESH_INTERVAL}s  │  {now.strftime('%H:%M:%S')}{RESET}")
+    add(f"  {DIM}Press Ctrl+C to exit  │  Updates every {REFRESH_INTERVAL}s  │  {now.strftime('%H:%M:%S')}{RESET}".encode("utf-8"))
 
-    return "\n".join(lines)
+    return bytes(buf)
 
 # ============================================================================
 # MAIN LOOP
@@ -268,12 +384,18 @@ def render_dashboard():
 
 def main():
     """Main monitor loop."""
-    print(f"\n{BOLD}Starting HyperIndex Monitor...{RESET}\n")
+    print(f"\n{BOLD}Starting HyperIndex Monitor...{RESET}\n", flush=True)
+
+    # Looked up here, not at import: sys.stdout may be None or lack .buffer
+    stdout = sys.stdout.buffer
 
     try:
         while True:
-            clear_screen()
-            print(render_dashboard())
+            # Buffered writes, one flush: a single syscall per frame
+            stdout.write(CLEAR_SCREEN)
+            stdout.write(render_dashboard())
+            stdout.write(b"\n")
+            stdout.flush()
             time.sleep(REFRESH_INTERVAL)
     except KeyboardInterrupt:
         print(f"\n\n{YELLOW}Monitor stopped.{RESET}\n")
@@ -10,11 +10,13 @@ Usage:
 """
 
 import os
+import signal
 import subprocess
 import sys
 import time
 import logging
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -23,10 +25,13 @@ GENERATOR_SCRIPT = BASE_DIR / "generator.py"
 LOCK_FILE = BASE_DIR / "scheduler.lock"
 
 SCHEDULE_HOURS = list(range(24))  # Every hour on the hour
-CHECK_INTERVAL = 60  # Check every 60 seconds
+GENERATOR_TIMEOUT = 300  # seconds
+USE_SUBPROCESS = False  # True: run generator.py in a child process for isolation
+USE_ALARM = os.name == "posix" and hasattr(signal, "setitimer")  # Wait via SIGALRM + pause()
+MAX_WAIT = 300  # seconds; re-check the wall clock at least this often (suspend, clock steps)
 
-# Track last run to avoid double-runs
-last_run_hour = None
+# In-process generator run, kept so a run that outlives the timeout isn't overlapped
+generator_thread = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +44,124 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class WaitTimeout(Exception):
+    """Raised by the SIGALRM handler to break out of a blocking waitpid()."""
+
+
+def raise_wait_timeout(signum, frame):
+    """Unlike ignore_alarm, raise: waitpid() is retried after a handler that returns."""
+    raise WaitTimeout
+
+
+def wait_child(pid, timeout):
+    """Wait up to `timeout` seconds for child `pid`; return its wait status, or None on timeout.
+
+    On POSIX, blocks in waitpid(pid, 0) under one ITIMER_REAL, so the
+    daemon sleeps until the child exits or the deadline passes.
+    """
+    if not USE_ALARM:
+        deadline = time.monotonic() + timeout
+        while True:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                return status
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.5)
+
+    previous_handler = signal.signal(signal.SIGALRM, raise_wait_timeout)
+    try:
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+        return os.waitpid(pid, 0)[1]
+    except WaitTimeout:
+        return None
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def spawn_to_log(cmd, timeout):
+    """posix_spawn `cmd` with stdout/stderr appended to LOG_FILE; return its exit code.
+
+    Avoids fork() copying the daemon's page tables. generator.py resolves
+    its paths from __file__, so the child doesn't need cwd=BASE_DIR.
+    """
+    file_actions = [
+        (os.POSIX_SPAWN_OPEN, 1, str(LOG_FILE), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644),
+        (os.POSIX_SPAWN_DUP2, 1, 2),
+    ]
+    pid = os.posix_spawnp(cmd[0], cmd, os.environ, file_actions=file_actions)
+
+    status = wait_child(pid, timeout)
+    if status is None:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    # Same convention as Popen.returncode: negative signal number if killed
+    return os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+
+
+def run_generator_subprocess():
+    """Run generator.py in a child Python process.
+
+    The child's stdout/stderr go straight to scheduler.log (O_APPEND, so
+    they interleave safely with our own handler) instead of through pipes.
+    Uses posix_spawn where available, subprocess elsewhere.
+    """
+    cmd = ["python3", str(GENERATOR_SCRIPT)]
+    if hasattr(os, "posix_spawnp"):
+        returncode = spawn_to_log(cmd, GENERATOR_TIMEOUT)
+    else:
+        with open(LOG_FILE, "ab", buffering=0) as log_fh:
+            returncode = subprocess.run(
+                cmd,
+                cwd=str(BASE_DIR),
+                stdout=log_fh,
+                stderr=log_fh,
+                timeout=GENERATOR_TIMEOUT
+            ).returncode
+
+    if returncode == 0:
+        logger.info("Generator completed successfully")
+    else:
+        logger.error(f"Generator failed (exit {returncode}), output above in {LOG_FILE.name}")
+
+
+def run_generator_in_process():
+    """Run generator.generate() in a worker thread, bounded by GENERATOR_TIMEOUT.
+
+    The module is imported once and reused, so later runs skip interpreter
+    startup and dependency imports. Its logger propagates to the root
+    handlers configured above, so generator output lands in scheduler.log.
+    """
+    global generator_thread
+
+    if generator_thread is not None and generator_thread.is_alive():
+        logger.error("Previous generator run still in progress, skipping this run")
+        return
+
+    import generator
+
+    errors = []
+
+    def target():
+        try:
+            generator.generate()
+        except Exception as e:
+            errors.append(e)
+            logger.error(f"Generator failed: {e}", exc_info=True)
+
+    generator_thread = threading.Thread(target=target, name="generator", daemon=True)
+    generator_thread.start()
+    generator_thread.join(timeout=GENERATOR_TIMEOUT)
+
+    if generator_thread.is_alive():
+        logger.error(f"Generator timed out after {GENERATOR_TIMEOUT}s (still running)")
+    elif not errors:
+        logger.info("Generator completed successfully")
+
+
 def run_generator():
     """Run the generator (which also updates history internally)."""
     logger.info("=" * 50)
@@ -47,22 +170,58 @@ def run_generator():
 
     try:
         logger.info("Running generator.py...")
-        result = subprocess.run(
-            ["python3", str(GENERATOR_SCRIPT)],
-            cwd=str(BASE_DIR),
-            capture_output=True,
-            text=True,
-            timeout=300
-        )
-        if result.returncode == 0:
-            logger.info("Generator completed successfully")
+        if USE_SUBPROCESS:
+            run_generator_subprocess()
         else:
-            logger.error(f"Generator failed: {result.stderr}")
+            run_generator_in_process()
 
     except Exception as e:
         logger.error(f"Error during scheduled run: {e}")
 
 
+def next_fire_time(after):
+    """Return the first scheduled run time strictly after `after`."""
+    today = after.date()
+
+    for hour in SCHEDULE_HOURS:
+        scheduled = datetime.combine(today, datetime.min.time().replace(hour=hour))
+        if scheduled > after:
+            return scheduled
+
+    # Next run is tomorrow at first scheduled hour
+    tomorrow = today + timedelta(days=1)
+    return datetime.combine(tomorrow, datetime.min.time().replace(hour=SCHEDULE_HOURS[0]))
+
+
+def ignore_alarm(signum, frame):
+    """No-op: SIGALRM only needs to interrupt signal.pause()."""
+
+
+def sleep_until(deadline):
+    """Sleep until the given time.monotonic() deadline.
+
+    On POSIX, arms one ITIMER_REAL and pause()s so the kernel wakes us once.
+    The 1s re-arm interval covers an alarm that fires before pause() starts.
+    """
+    remaining = deadline - time.monotonic()
+
+    if not USE_ALARM:
+        while remaining > 0:
+            time.sleep(remaining)
+            remaining = deadline - time.monotonic()
+        return
+
+    previous_handler = signal.signal(signal.SIGALRM, ignore_alarm)
+    try:
+        while remaining > 0:
+            signal.setitimer(signal.ITIMER_REAL, remaining, 1.0)
+            signal.pause()
+            remaining = deadline - time.monotonic()
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
 def acquire_lock():
     """Ensure only one scheduler instance runs at a time."""
     if LOCK_FILE.exists():
@@ -84,36 +243,31 @@ def release_lock():
 
 
 def main():
-    global last_run_hour
-
     acquire_lock()
 
     logger.info("HyperIndex Scheduler starting...")
     logger.info(f"Schedule: {SCHEDULE_HOURS} (hours)")
-    logger.info(f"Check interval: {CHECK_INTERVAL}s")
+
+    # A few long sleeps per scheduled run instead of polling the clock
+    next_run = next_fire_time(datetime.now())
 
     while True:
-        try:
-            now = datetime.now()
-            current_hour = now.hour
-            current_minute = now.minute
-
-            # Check if it's a scheduled hour and we haven't run this hour yet
-            if current_hour in SCHEDULE_HOURS and current_hour != last_run_hour:
-                # Run within first 5 minutes of the hour
-                if current_minute < 5:
-                    logger.info(f"Schedule triggered: {now.strftime('%Y-%m-%d %H:%M')}")
-                    run_generator()
-                    last_run_hour = current_hour
-
-            # Reset last_run_hour when we're past the schedule windows
-            if current_hour not in SCHEDULE_HOURS:
-                last_run_hour = None
+        logger.info(f"Next run: {next_run.strftime('%Y-%m-%d %H:%M')}")
+        # Monotonic time stops during suspend, so cap each wait and
+        # re-derive the remainder from the wall clock
+        remaining = (next_run - datetime.now()).total_seconds()
+        while remaining > 0:
+            sleep_until(time.monotonic() + min(remaining, MAX_WAIT))
+            remaining = (next_run - datetime.now()).total_seconds()
 
+        try:
+            logger.info(f"Schedule triggered: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+            run_generator()
         except Exception as e:
             logger.error(f"Scheduler error: {e}")
 
-        time.sleep(CHECK_INTERVAL)
+        # Strictly after the slot just run, even if the clock stepped backwards
+        next_run = next_fire_time(max(datetime.now(), next_run))
 
 
 if __name__ == "__main__":